@@ -9,7 +9,8 @@ sys.path.append(os.getcwd())
 from sqlalchemy import engine_from_config, pool
 from alembic import context
 
-from app.db.session import Base
+from app.db.base import Base
+from app.db import models  # noqa: F401  (register tables on Base.metadata)
 from app.core.config import settings
 
 config = context.config
@@ -22,17 +23,20 @@ except Exception:
     logging.basicConfig(level=logging.INFO)
     logging.getLogger("alembic").info("alembic.ini missing logging sections — using basic logging")
 
-# Use settings.DATABASE_URL, but if it's async (aiomysql) use a sync fallback for alembic:
+# Use settings.DATABASE_URL, but if it's async (asyncmy / aiomysql) use a sync fallback for alembic:
 database_url = getattr(settings, "DATABASE_URL", None)
 if not database_url:
     raise RuntimeError("DATABASE_URL not found in app.core.config.settings")
 
-# If the URL uses async driver (aiomysql), create a sync equivalent replacing driver
-if "+aiomysql" in database_url:
-    sync_url = database_url.replace("+aiomysql", "+pymysql")
-    logging.getLogger("alembic").info("Using sync DB URL for migrations (pymysql) instead of aiomysql")
-else:
-    sync_url = database_url
+# If the URL uses an async driver, create a sync equivalent replacing driver
+sync_url = database_url
+for async_driver in ("+asyncmy", "+aiomysql"):
+    if async_driver in database_url:
+        sync_url = database_url.replace(async_driver, "+pymysql")
+        logging.getLogger("alembic").info(
+            "Using sync DB URL for migrations (pymysql) instead of %s", async_driver[1:]
+        )
+        break
 
 # set sqlalchemy.url for alembic
 config.set_main_option("sqlalchemy.url", sync_url)
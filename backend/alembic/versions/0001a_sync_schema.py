@@ -0,0 +1,182 @@
+# alembic/versions/0001a_sync_schema.py
+# bring the 0001_initial stub up to the schema in sql/sql before the index revisions:
+# approval / is_active columns on properties, password_hash on users, DATE booking
+# days, refresh_tokens renamed to user_refresh_tokens (+ revoked), FKs and the
+# single-column indexes sql/sql shipped with.
+# a database created from the current sql/sql is already at head: `alembic stamp head`
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001a_sync_schema'
+down_revision = '0001_initial'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    with op.batch_alter_table('users') as batch:
+        batch.alter_column('hashed_password', new_column_name='password_hash',
+                           existing_type=sa.String(length=256), type_=sa.String(length=255),
+                           existing_nullable=False)
+        batch.alter_column('name', existing_type=sa.String(length=128), type_=sa.String(length=255),
+                           existing_nullable=False)
+        batch.alter_column('email', existing_type=sa.String(length=256), type_=sa.String(length=255),
+                           existing_nullable=False)
+        batch.alter_column('phone', existing_type=sa.String(length=32), type_=sa.String(length=10),
+                           existing_nullable=False)
+        batch.alter_column('role', existing_type=sa.String(length=16), type_=sa.String(length=20),
+                           existing_nullable=False, server_default='user')
+        batch.drop_column('updated_at')
+        batch.create_unique_constraint('uq_users_email', ['email'])
+        batch.create_index('idx_users_role', ['role'])
+
+    with op.batch_alter_table('properties') as batch:
+        batch.add_column(sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.true()))
+        batch.add_column(sa.Column('approval_status', sa.String(length=20), nullable=False,
+                                   server_default='pending'))
+        batch.add_column(sa.Column('approved_at', sa.DateTime(), nullable=True))
+        batch.add_column(sa.Column('approved_by_admin_id', sa.Integer(), nullable=True))
+
+    # listings that were live before the approval workflow stay live;
+    # unavailable or soft-deleted ones become inactive
+    props = sa.table('properties',
+                     sa.column('available', sa.Boolean()),
+                     sa.column('deleted_at', sa.DateTime()),
+                     sa.column('is_active', sa.Boolean()),
+                     sa.column('approval_status', sa.String()))
+    op.execute(props.update().values(
+        is_active=sa.and_(props.c.available, props.c.deleted_at.is_(None)),
+        approval_status='approved',
+    ))
+
+    with op.batch_alter_table('properties') as batch:
+        batch.drop_column('available')
+        batch.drop_column('updated_at')
+        batch.drop_column('deleted_at')
+        batch.alter_column('title', existing_type=sa.String(length=256), type_=sa.String(length=255),
+                           existing_nullable=False)
+        batch.alter_column('price', existing_type=sa.Float(), type_=sa.Numeric(10, 2),
+                           existing_nullable=False)
+        batch.alter_column('type', existing_type=sa.String(length=32), type_=sa.String(length=50),
+                           existing_nullable=False, server_default='Room')
+        batch.alter_column('gender', existing_type=sa.String(length=16), type_=sa.String(length=20),
+                           existing_nullable=False, server_default='Any')
+        batch.alter_column('city', existing_type=sa.String(length=128), type_=sa.String(length=100),
+                           existing_nullable=False)
+        batch.alter_column('locality', existing_type=sa.String(length=128), type_=sa.String(length=255),
+                           existing_nullable=True)
+        batch.create_index('idx_properties_host_id', ['host_id'])
+        batch.create_index('idx_properties_city', ['city'])
+        batch.create_index('idx_properties_price', ['price'])
+        batch.create_index('idx_properties_is_active', ['is_active'])
+        batch.create_index('idx_properties_approval_status', ['approval_status'])
+        batch.create_index('idx_properties_approved_by_admin_id', ['approved_by_admin_id'])
+        batch.create_foreign_key('fk_properties_host_id_users', 'users',
+                                 ['host_id'], ['id'], ondelete='CASCADE')
+        batch.create_foreign_key('fk_properties_approved_by_admin_id_users', 'users',
+                                 ['approved_by_admin_id'], ['id'], ondelete='SET NULL')
+
+    with op.batch_alter_table('bookings') as batch:
+        batch.drop_column('total_price')
+        batch.drop_column('cancelled_at')
+        batch.alter_column('start_date', existing_type=sa.DateTime(), type_=sa.Date(),
+                           existing_nullable=False)
+        batch.alter_column('end_date', existing_type=sa.DateTime(), type_=sa.Date(),
+                           existing_nullable=False)
+        batch.alter_column('status', existing_type=sa.String(length=32), type_=sa.String(length=20),
+                           existing_nullable=False, server_default='pending')
+        batch.create_index('idx_bookings_user_id', ['user_id'])
+        batch.create_index('idx_bookings_property_id', ['property_id'])
+        batch.create_index('idx_bookings_start_date', ['start_date'])
+        batch.create_foreign_key('fk_bookings_user_id_users', 'users',
+                                 ['user_id'], ['id'], ondelete='CASCADE')
+        batch.create_foreign_key('fk_bookings_property_id_properties', 'properties',
+                                 ['property_id'], ['id'], ondelete='CASCADE')
+
+    op.rename_table('refresh_tokens', 'user_refresh_tokens')
+    with op.batch_alter_table('user_refresh_tokens') as batch:
+        batch.add_column(sa.Column('revoked', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch.alter_column('token', existing_type=sa.String(length=512), type_=sa.Text(),
+                           existing_nullable=False)
+        batch.create_index('idx_user_refresh_tokens_user_id', ['user_id'])
+        batch.create_index('idx_user_refresh_tokens_token', ['token'], mysql_length=191)
+        batch.create_foreign_key('fk_user_refresh_tokens_user_id_users', 'users',
+                                 ['user_id'], ['id'], ondelete='CASCADE')
+
+def downgrade():
+    with op.batch_alter_table('user_refresh_tokens') as batch:
+        batch.drop_constraint('fk_user_refresh_tokens_user_id_users', type_='foreignkey')
+        batch.drop_index('idx_user_refresh_tokens_token')
+        batch.drop_index('idx_user_refresh_tokens_user_id')
+        batch.alter_column('token', existing_type=sa.Text(), type_=sa.String(length=512),
+                           existing_nullable=False)
+        batch.drop_column('revoked')
+    op.rename_table('user_refresh_tokens', 'refresh_tokens')
+
+    with op.batch_alter_table('bookings') as batch:
+        batch.drop_constraint('fk_bookings_property_id_properties', type_='foreignkey')
+        batch.drop_constraint('fk_bookings_user_id_users', type_='foreignkey')
+        batch.drop_index('idx_bookings_start_date')
+        batch.drop_index('idx_bookings_property_id')
+        batch.drop_index('idx_bookings_user_id')
+        batch.alter_column('status', existing_type=sa.String(length=20), type_=sa.String(length=32),
+                           existing_nullable=False, server_default=None)
+        batch.alter_column('end_date', existing_type=sa.Date(), type_=sa.DateTime(),
+                           existing_nullable=False)
+        batch.alter_column('start_date', existing_type=sa.Date(), type_=sa.DateTime(),
+                           existing_nullable=False)
+        batch.add_column(sa.Column('cancelled_at', sa.DateTime(), nullable=True))
+        batch.add_column(sa.Column('total_price', sa.Float(), nullable=False, server_default='0'))
+
+    with op.batch_alter_table('properties') as batch:
+        batch.drop_constraint('fk_properties_approved_by_admin_id_users', type_='foreignkey')
+        batch.drop_constraint('fk_properties_host_id_users', type_='foreignkey')
+        batch.drop_index('idx_properties_approved_by_admin_id')
+        batch.drop_index('idx_properties_approval_status')
+        batch.drop_index('idx_properties_is_active')
+        batch.drop_index('idx_properties_price')
+        batch.drop_index('idx_properties_city')
+        batch.drop_index('idx_properties_host_id')
+        batch.alter_column('locality', existing_type=sa.String(length=255), type_=sa.String(length=128),
+                           existing_nullable=True)
+        batch.alter_column('city', existing_type=sa.String(length=100), type_=sa.String(length=128),
+                           existing_nullable=False)
+        batch.alter_column('gender', existing_type=sa.String(length=20), type_=sa.String(length=16),
+                           existing_nullable=False, server_default=None)
+        batch.alter_column('type', existing_type=sa.String(length=50), type_=sa.String(length=32),
+                           existing_nullable=False, server_default=None)
+        batch.alter_column('price', existing_type=sa.Numeric(10, 2), type_=sa.Float(),
+                           existing_nullable=False)
+        batch.alter_column('title', existing_type=sa.String(length=255), type_=sa.String(length=256),
+                           existing_nullable=False)
+        batch.add_column(sa.Column('deleted_at', sa.DateTime(), nullable=True))
+        batch.add_column(sa.Column('updated_at', sa.DateTime(), nullable=False,
+                                   server_default=sa.func.now()))
+        batch.add_column(sa.Column('available', sa.Boolean(), nullable=False, server_default=sa.true()))
+
+    props = sa.table('properties',
+                     sa.column('available', sa.Boolean()),
+                     sa.column('is_active', sa.Boolean()))
+    op.execute(props.update().values(available=props.c.is_active))
+
+    with op.batch_alter_table('properties') as batch:
+        batch.drop_column('approved_by_admin_id')
+        batch.drop_column('approved_at')
+        batch.drop_column('approval_status')
+        batch.drop_column('is_active')
+
+    with op.batch_alter_table('users') as batch:
+        batch.drop_index('idx_users_role')
+        batch.drop_constraint('uq_users_email', type_='unique')
+        batch.add_column(sa.Column('updated_at', sa.DateTime(), nullable=False,
+                                   server_default=sa.func.now()))
+        batch.alter_column('role', existing_type=sa.String(length=20), type_=sa.String(length=16),
+                           existing_nullable=False, server_default=None)
+        batch.alter_column('phone', existing_type=sa.String(length=10), type_=sa.String(length=32),
+                           existing_nullable=False)
+        batch.alter_column('email', existing_type=sa.String(length=255), type_=sa.String(length=256),
+                           existing_nullable=False)
+        batch.alter_column('name', existing_type=sa.String(length=255), type_=sa.String(length=128),
+                           existing_nullable=False)
+        batch.alter_column('password_hash', new_column_name='hashed_password',
+                           existing_type=sa.String(length=255), type_=sa.String(length=256),
+                           existing_nullable=False)
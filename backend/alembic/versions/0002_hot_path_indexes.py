@@ -0,0 +1,18 @@
+# alembic/versions/0002_hot_path_indexes.py
+# composite indexes for the public listing, booking history and availability queries
+from alembic import op
+
+revision = '0002_hot_path_indexes'
+down_revision = '0001a_sync_schema'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index('ix_properties_city_status_price', 'properties', ['city', 'approval_status', 'price'])
+    op.create_index('ix_bookings_user_start', 'bookings', ['user_id', 'start_date'])
+    op.create_index('ix_bookings_property_dates', 'bookings', ['property_id', 'start_date', 'end_date'])
+
+def downgrade():
+    op.drop_index('ix_bookings_property_dates', table_name='bookings')
+    op.drop_index('ix_bookings_user_start', table_name='bookings')
+    op.drop_index('ix_properties_city_status_price', table_name='properties')
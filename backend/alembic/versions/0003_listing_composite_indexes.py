@@ -0,0 +1,51 @@
+# alembic/versions/0003_listing_composite_indexes.py
+# composite indexes covering the public listing WHERE + ORDER BY and the host dashboards;
+# ix_properties_city_status_price (0002) is superseded by ix_prop_public_price
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = '0003_listing_composite_indexes'
+down_revision = '0002_hot_path_indexes'
+branch_labels = None
+depends_on = None
+
+# single-column indexes whose column now leads a composite (which also backs the FK on MySQL):
+# idx_* from sql/sql / 0001a_sync_schema, ix_* from databases built with create_all
+_SUPERSEDED = {
+    'properties': [('host_id', 'idx_properties_host_id', 'ix_properties_host_id'),
+                   ('approval_status', 'idx_properties_approval_status', 'ix_properties_approval_status')],
+    'bookings': [('user_id', 'idx_bookings_user_id', 'ix_bookings_user_id'),
+                 ('property_id', 'idx_bookings_property_id', 'ix_bookings_property_id')],
+}
+
+def _index_names(table):
+    # offline (--sql) there is nothing to inspect; assume the names 0001a_sync_schema created
+    if context.is_offline_mode():
+        return None
+    return {ix['name'] for ix in sa.inspect(op.get_bind()).get_indexes(table)}
+
+def upgrade():
+    op.create_index('ix_prop_public_recent', 'properties', ['approval_status', 'is_active', 'city', 'id'])
+    op.create_index('ix_prop_public_price', 'properties', ['approval_status', 'is_active', 'city', 'price'])
+    op.create_index('ix_prop_host_recent', 'properties', ['host_id', 'id'])
+    op.create_index('ix_bookings_host_recent', 'bookings', ['property_id', 'id'])
+    op.drop_index('ix_properties_city_status_price', table_name='properties')
+
+    for table, indexes in _SUPERSEDED.items():
+        existing = _index_names(table)
+        for _, *names in indexes:
+            for name in names:
+                if (name in existing) if existing is not None else name.startswith('idx_'):
+                    op.drop_index(name, table_name=table)
+
+def downgrade():
+    for table, indexes in _SUPERSEDED.items():
+        existing = _index_names(table)
+        for column, name, create_all_name in indexes:
+            if existing is None or not {name, create_all_name} & existing:
+                op.create_index(name, table, [column])
+    op.create_index('ix_properties_city_status_price', 'properties', ['city', 'approval_status', 'price'])
+    op.drop_index('ix_bookings_host_recent', table_name='bookings')
+    op.drop_index('ix_prop_host_recent', table_name='properties')
+    op.drop_index('ix_prop_public_price', table_name='properties')
+    op.drop_index('ix_prop_public_recent', table_name='properties')
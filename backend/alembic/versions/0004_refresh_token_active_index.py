@@ -0,0 +1,32 @@
+# alembic/versions/0004_refresh_token_active_index.py
+# (user_id, revoked) index for the revoke-all UPDATE in save_refresh_token;
+# it leads with user_id, so the single-column user_id index goes
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = '0004_refresh_token_active_index'
+down_revision = '0003_listing_composite_indexes'
+branch_labels = None
+depends_on = None
+
+# idx_* from sql/sql / 0001a_sync_schema, ix_* from databases built with create_all
+_SUPERSEDED = ('idx_user_refresh_tokens_user_id', 'ix_user_refresh_tokens_user_id')
+
+def _index_names():
+    # offline (--sql) there is nothing to inspect; assume the name 0001a_sync_schema created
+    if context.is_offline_mode():
+        return None
+    return {ix['name'] for ix in sa.inspect(op.get_bind()).get_indexes('user_refresh_tokens')}
+
+def upgrade():
+    op.create_index('ix_urt_user_active', 'user_refresh_tokens', ['user_id', 'revoked'])
+    existing = _index_names()
+    for name in _SUPERSEDED:
+        if (name in existing) if existing is not None else name.startswith('idx_'):
+            op.drop_index(name, table_name='user_refresh_tokens')
+
+def downgrade():
+    existing = _index_names()
+    if existing is None or not set(_SUPERSEDED) & existing:
+        op.create_index('idx_user_refresh_tokens_user_id', 'user_refresh_tokens', ['user_id'])
+    op.drop_index('ix_urt_user_active', table_name='user_refresh_tokens')
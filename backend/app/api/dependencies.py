@@ -1,39 +1,71 @@
 # app/api/dependencies.py
 import logging
-from typing import AsyncGenerator
+import threading
+from dataclasses import dataclass
+from typing import Optional
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
+from jwt import PyJWTError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from app.db.session import get_db
 from app.db.models import User
-from app.core.security import decode_token  # use the actual function you have
+from app.core.security import verify_access_token
 
 logger = logging.getLogger("uvicorn.error")
-security = HTTPBearer(auto_error=False)
 
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async for s in get_db():
-        yield s
+@dataclass(frozen=True)
+class UserSnapshot:
+    """
+    Detached copy of the User fields routes read from current_user.
+    Served from user_cache so authenticated requests skip the users SELECT.
+    """
+    id: int
+    name: str
+    email: str
+    phone: Optional[str]
+    role: str
 
 
-async def get_current_user(
-    db: AsyncSession = Depends(get_db_session),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> User:
-    if credentials is None:
+USER_CACHE_TTL_SECONDS = 30
+user_cache: TTLCache = TTLCache(maxsize=5000, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop a cached snapshot; call after changing a user's role or profile.
+    """
+    with _user_cache_lock:
+        user_cache.pop(user_id, None)
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """
+    Identity carried by a verified access token. Enough for routes that only
+    need the caller's id/role, without touching the users table.
+    """
+    id: int
+    role: str
+
+
+async def get_current_claims(request: Request) -> TokenClaims:
+    # read "Authorization: Bearer <token>" directly; cheaper than HTTPBearer
+    auth = request.headers.get("authorization")
+    scheme, _, token = auth.partition(" ") if auth else ("", "", "")
+    if scheme.lower() != "bearer" or not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated"
         )
 
-    token = credentials.credentials
     try:
-        payload = decode_token(token)  # must return a dict-like payload
-    except JWTError:
+        # access tokens only: refresh tokens must never work as a bearer.
+        # verify_access_token serves recently verified tokens from token_cache
+        payload = verify_access_token(token)
+    except PyJWTError:
         logger.exception("token decode error")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
@@ -44,30 +76,60 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         )
 
-    user_id = payload.get("sub") or payload.get("user_id")
-    if user_id is None:
+    # tokens carry the user id as an int "user_id" claim (see auth.py);
+    # "sub" can't be used for it since JWT requires sub to be a string
+    uid = payload.get("user_id")
+    if not isinstance(uid, int):
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token user id"
         )
-
-    try:
-        uid = int(user_id)
-    except Exception:
+    role = payload.get("role")
+    if not isinstance(role, str):
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token user id"
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token role"
         )
+    return TokenClaims(id=uid, role=role)
 
-    res = await db.execute(select(User).where(User.id == uid))
-    user = res.scalar_one_or_none()
+
+async def get_current_user(
+    claims: TokenClaims = Depends(get_current_claims),
+    db: AsyncSession = Depends(get_db),
+) -> UserSnapshot:
+    """
+    User record for routes that need more than id/role, or the role as
+    stored rather than as issued in the token. Served from user_cache, so it
+    can lag the database by up to USER_CACHE_TTL_SECONDS unless the entry is
+    dropped with invalidate_cached_user.
+    """
+    uid = claims.id
+    with _user_cache_lock:
+        cached = user_cache.get(uid)
+    if cached is not None:
+        return cached
+
+    # identity-map lookup first; only emits SQL when the user isn't loaded
+    user = await db.get(User, uid)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
         )
-    return user
+
+    snapshot = UserSnapshot(
+        id=user.id,
+        name=user.name,
+        email=user.email,
+        phone=user.phone,
+        role=user.role,
+    )
+    with _user_cache_lock:
+        user_cache[uid] = snapshot
+    return snapshot
 
 
 def require_role(role: str):
-    async def dep(user: User = Depends(get_current_user)) -> User:
+    # checks the stored role (UserSnapshot), not the token's role claim, so a
+    # demotion applies without waiting for the access token to expire
+    async def dep(user: UserSnapshot = Depends(get_current_user)) -> UserSnapshot:
         # allow role OR admin to pass
         if user.role != role and user.role != "admin":
             raise HTTPException(
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, select
 
-from app.api.dependencies import require_role
+from app.api.dependencies import invalidate_cached_user, require_role
 from app.db.session import get_db
 from app.db.models import User, Property, Booking
 from app.db import crud_users, crud_properties
-from app.schemas.user import UserBase, UserRoleUpdate
+from app.schemas.property import AdminPropertiesResponse, admin_property_out
+from app.schemas.user import AdminUsersResponse, UserBase, UserRoleUpdate
 
 
 router = APIRouter()
@@ -17,9 +18,13 @@ async def admin_stats(
     db: AsyncSession = Depends(get_db),
     current_user=Depends(require_role("admin")),
 ):
-    users_count = (await db.execute(select(func.count(User.id)))).scalar_one()
-    props_count = (await db.execute(select(func.count(Property.id)))).scalar_one()
-    bookings_count = (await db.execute(select(func.count(Booking.id)))).scalar_one()
+    # one round trip: SELECT (SELECT COUNT(*) ...), (SELECT COUNT(*) ...), ...
+    stmt = select(
+        select(func.count(User.id)).scalar_subquery(),
+        select(func.count(Property.id)).scalar_subquery(),
+        select(func.count(Booking.id)).scalar_subquery(),
+    )
+    users_count, props_count, bookings_count = (await db.execute(stmt)).one()
     return {
         "total_users": users_count,
         "total_properties": props_count,
@@ -27,13 +32,25 @@ async def admin_stats(
     }
 
 
-@router.get("/users")
+@router.get("/users", response_model=AdminUsersResponse)
 async def admin_users(
     db: AsyncSession = Depends(get_db),
     current_user=Depends(require_role("admin")),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=200),
 ):
-    users = await crud_users.list_users(db)
-    return {"data": [UserBase.model_validate(u) for u in users]}
+    users, total = await crud_users.list_users(db, page=page, per_page=per_page)
+    page_obj = {
+        # trusted rows; model_construct skips EmailStr/field validation per row
+        "items": [
+            UserBase.model_construct(**{f: getattr(u, f) for f in UserBase.model_fields})
+            for u in users
+        ],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+    }
+    return {"data": page_obj}
 
 
 @router.put("/users/{user_id}/role")
@@ -46,31 +63,54 @@ async def set_role(
     if body.role not in ["user", "host", "admin"]:
         raise HTTPException(status_code=400, detail="Invalid role")
     user = await crud_users.update_user_role(db, user_id, body.role)
+    # require_role reads the cached UserSnapshot; drop it so the new role applies
+    # on this worker's next request (other workers within USER_CACHE_TTL_SECONDS)
+    invalidate_cached_user(user_id)
     return UserBase.model_validate(user)
 
 
-@router.get("/properties")
+@router.get("/properties", response_model=AdminPropertiesResponse)
 async def admin_properties(
     db: AsyncSession = Depends(get_db),
     current_user=Depends(require_role("admin")),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=200),
 ):
     """
     Full property list for admin (any approval_status).
     """
-    items = await crud_properties.list_all_properties_with_uploader(db)
-    return {"data": {"items": items}}
+    items, total = await crud_properties.list_all_properties_with_uploader(
+        db, page=page, per_page=per_page
+    )
+    page_obj = {
+        "items": [admin_property_out(p) for p in items],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+    }
+    return {"data": page_obj}
 
 
-@router.get("/properties/pending")
+@router.get("/properties/pending", response_model=AdminPropertiesResponse)
 async def admin_pending_properties(
     db: AsyncSession = Depends(get_db),
     current_user=Depends(require_role("admin")),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=200),
 ):
     """
     Only pending listings, for review.
     """
-    items = await crud_properties.list_pending_properties_with_uploader(db)
-    return {"data": {"items": items}}
+    items, total = await crud_properties.list_pending_properties_with_uploader(
+        db, page=page, per_page=per_page
+    )
+    page_obj = {
+        "items": [admin_property_out(p) for p in items],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+    }
+    return {"data": page_obj}
 
 
 @router.post("/properties/{prop_id}/approve")
@@ -1,23 +1,28 @@
 # app/api/routers/auth.py
 from typing import Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status, Body
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Body
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError
+from jwt import PyJWTError
 
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal, get_db
 from app.db import crud_users
 from app.schemas.auth import Token
 from app.schemas.user import UserCreate, UserOut
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    verify_password,
+    verify_and_update_password,
     decode_token,
 )
 
 router = APIRouter()
 
+# optional persistence hooks, resolved once instead of hasattr() per request
+_SAVE_REFRESH = getattr(crud_users, "save_refresh_token", None)
+_REVOKE_REFRESH = getattr(crud_users, "revoke_refresh_token", None)
+
 
 def _token_response(user, access: str, refresh: str) -> Dict[str, Any]:
     """
@@ -32,8 +37,27 @@ def _token_response(user, access: str, refresh: str) -> Dict[str, Any]:
     }
 
 
+async def _persist_refresh_token(user_id: int, token: str) -> None:
+    """
+    Background task: store the refresh token after the response is sent.
+    Uses its own session because the request-scoped one may already be closed.
+    """
+    # persist refresh if function exists; don't fail if it errors
+    if _SAVE_REFRESH is None:
+        return
+    try:
+        async with AsyncSessionLocal() as db:
+            await _SAVE_REFRESH(db, user_id, token)
+    except Exception:
+        pass
+
+
 @router.post("/register", response_model=Token)
-async def register(payload: UserCreate, db: AsyncSession = Depends(get_db)):
+async def register(
+    payload: UserCreate,
+    background: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
     existing = await crud_users.get_user_by_email(db, payload.email)
     if existing:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email exists")
@@ -49,18 +73,14 @@ async def register(payload: UserCreate, db: AsyncSession = Depends(get_db)):
     data = {"user_id": user.id, "role": user.role}
     access = create_access_token(data)
     refresh = create_refresh_token(data)
-    # persist refresh if function exists; don't fail if it errors
-    try:
-        if hasattr(crud_users, "save_refresh_token"):
-            await crud_users.save_refresh_token(db, user.id, refresh)
-    except Exception:
-        pass
+    background.add_task(_persist_refresh_token, user.id, refresh)
 
     return _token_response(user, access, refresh)
 
 
 @router.post("/login", response_model=Token)
 async def login(
+    background: BackgroundTasks,
     form_data: Dict[str, Any] = Body(...),
     db: AsyncSession = Depends(get_db),
 ):
@@ -71,26 +91,32 @@ async def login(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing email or password")
 
     user = await crud_users.get_user_by_email(db, email)
-    if not user or not verify_password(password, user.hashed_password):
+    # argon2 takes ~100 ms of CPU; run it off the event loop
+    verified, new_hash = (
+        await run_in_threadpool(verify_and_update_password, password, user.hashed_password)
+        if user
+        else (False, None)
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
+    # legacy pbkdf2_sha256 hash -> rehash with argon2 (once per user)
+    if new_hash:
+        await crud_users.update_password_hash(db, user, new_hash)
 
     data = {"user_id": user.id, "role": user.role}
     access = create_access_token(data)
     refresh = create_refresh_token(data)
-    try:
-        if hasattr(crud_users, "save_refresh_token"):
-            await crud_users.save_refresh_token(db, user.id, refresh)
-    except Exception:
-        pass
+    background.add_task(_persist_refresh_token, user.id, refresh)
 
     return _token_response(user, access, refresh)
 
 
 @router.post("/refresh", response_model=Token)
 async def refresh(
+    background: BackgroundTasks,
     body: Dict[str, Any] = Body(...),
     db: AsyncSession = Depends(get_db),
 ):
@@ -103,7 +129,7 @@ async def refresh(
         payload = decode_token(token)
         if payload.get("type") != "refresh":
             raise ValueError("Not a refresh token")
-    except JWTError:
+    except PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token (jwt error)",
@@ -114,16 +140,10 @@ async def refresh(
             detail="Invalid refresh token",
         )
 
-    # Accept both 'sub' and 'user_id' claims
-    user_id = payload.get("sub") or payload.get("user_id")
-    if not user_id:
+    uid = payload.get("user_id")
+    if not isinstance(uid, int):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
-    try:
-        uid = int(user_id)
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid user id in token")
-
     user = await crud_users.get_user(db, uid)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -131,13 +151,8 @@ async def refresh(
     data = {"user_id": user.id, "role": user.role}
     new_access = create_access_token(data)
     new_refresh = create_refresh_token(data)
-
-    try:
-        if hasattr(crud_users, "save_refresh_token"):
-            await crud_users.save_refresh_token(db, user.id, new_refresh)
-    except Exception:
-        # don't block on refresh token persistence
-        pass
+    # don't block on refresh token persistence
+    background.add_task(_persist_refresh_token, user.id, new_refresh)
 
     return _token_response(user, new_access, new_refresh)
 
@@ -149,9 +164,9 @@ async def logout(
 ):
     # Frontend currently doesn't send body, so make this optional.
     token = (body or {}).get("refresh") or (body or {}).get("refresh_token")
-    if token and hasattr(crud_users, "revoke_refresh_token"):
+    if token and _REVOKE_REFRESH is not None:
         try:
-            await crud_users.revoke_refresh_token(db, token)
+            await _REVOKE_REFRESH(db, token)
         except Exception:
             pass
     return {"ok": True}
@@ -1,8 +1,11 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# pre-serialized; this is polled by health checks
+PING_BYTES = b'{"status":"ok"}'
+
 
 @router.get("/ping")
 async def compat_ping():
-    return {"status": "ok"}
+    return Response(content=PING_BYTES, media_type="application/json")
@@ -1,34 +1,82 @@
+import asyncio
+import uuid
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from pathlib import Path
-import shutil
 
-from app.api.dependencies import get_current_user   # <- use current user, not require_role
+import aiofiles
+
+from app.api.dependencies import get_current_claims, get_current_user   # <- use current user, not require_role
 from app.core.config import get_settings
 from app.db.session import get_db
 from app.db import crud_properties, crud_bookings
-from app.schemas.property import PropertyBase
-from app.schemas.booking import BookingOut
+from app.schemas.property import HostPropertiesResponse, PropertyBase, property_out
+from app.schemas.booking import BookingsPage
 
 router = APIRouter()
 
+# resolved once at import instead of on every upload request
+_UPLOAD_DIR = Path(get_settings().STATIC_UPLOAD_DIR)
+_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+_CHUNK_SIZE = 1024 * 1024
+
+
+async def _save(img: UploadFile, dest: Path) -> None:
+    """
+    Stream one uploaded image into dest.
+    """
+    async with aiofiles.open(dest, "wb") as f:
+        while chunk := await img.read(_CHUNK_SIZE):
+            await f.write(chunk)
+
+
+async def _save_all(images: list[UploadFile], host_id: int) -> list[str]:
+    """
+    Write all images concurrently and return their public URLs in upload order.
+    Every image gets its own file name, so two uploads called "photo.jpg" never
+    share a destination; if any write fails, the files already written are removed.
+    """
+    uploads = [img for img in images if img.filename]
+    names = [f"{host_id}_{uuid.uuid4().hex[:12]}_{img.filename}" for img in uploads]
+    dests = [_UPLOAD_DIR / name for name in names]
+
+    results = await asyncio.gather(
+        *[_save(img, dest) for img, dest in zip(uploads, dests)],
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            for dest in dests:
+                dest.unlink(missing_ok=True)
+            raise result
+    return [f"/static/uploads/{name}" for name in names]
+
 
-@router.get("/properties")
+@router.get("/properties", response_model=HostPropertiesResponse)
 async def host_properties(
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
+    current_user=Depends(get_current_claims),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=200),
 ):
     """
     List all properties for the currently authenticated user.
     Includes approval_status so host can see pending/approved/rejected.
     """
-    items = await crud_properties.list_properties_for_host(
+    items, total = await crud_properties.list_properties_for_host(
         db,
         host_id=current_user.id,
+        page=page,
+        per_page=per_page,
     )
-    data = {"items": [PropertyBase.model_validate(p) for p in items]}
+    data = {
+        "items": [property_out(p) for p in items],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+    }
     return {"data": data}
 
 
@@ -50,20 +98,9 @@ async def create_property(
     Saves uploaded images into STATIC_UPLOAD_DIR and stores their URLs.
     New properties ALWAYS start as approval_status='pending'.
     """
-    settings = get_settings()
-    upload_dir = Path(settings.STATIC_UPLOAD_DIR)
-    upload_dir.mkdir(parents=True, exist_ok=True)
-
     urls: list[str] = []
     if images:
-        for img in images:
-            if not img.filename:
-                continue
-            filename = f"{current_user.id}_{img.filename}"
-            dest = upload_dir / filename
-            with dest.open("wb") as f:
-                shutil.copyfileobj(img.file, f)
-            urls.append(f"/static/uploads/{filename}")
+        urls.extend(await _save_all(images, current_user.id))
 
     prop = await crud_properties.create_property(
         db,
@@ -110,20 +147,9 @@ async def update_property(
     if prop.host_id != current_user.id and getattr(current_user, "role", None) != "admin":
         raise HTTPException(status_code=403, detail="Not allowed")
 
-    settings = get_settings()
-    upload_dir = Path(settings.STATIC_UPLOAD_DIR)
-    upload_dir.mkdir(parents=True, exist_ok=True)
-
     urls: list[str] = list(prop.images or [])
     if images:
-        for img in images:
-            if not img.filename:
-                continue
-            filename = f"{current_user.id}_{img.filename}"
-            dest = upload_dir / filename
-            with dest.open("wb") as f:
-                shutil.copyfileobj(img.file, f)
-            urls.append(f"/static/uploads/{filename}")
+        urls.extend(await _save_all(images, current_user.id))
 
     data = {
         "title": title,
@@ -160,16 +186,25 @@ async def delete_property_host(
     return {"message": "deleted"}
 
 
-@router.get("/bookings")
+@router.get("/bookings", response_model=BookingsPage)
 async def host_bookings(
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
+    current_user=Depends(get_current_claims),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=200),
 ):
     """
     List all bookings for properties owned by the current user.
     """
-    bookings = await crud_bookings.list_bookings_for_host(
+    bookings, total = await crud_bookings.list_bookings_for_host(
         db,
         host_id=current_user.id,
+        page=page,
+        per_page=per_page,
     )
-    return {"items": [BookingOut.model_validate(b) for b in bookings]}
+    return {
+        "items": bookings,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+    }
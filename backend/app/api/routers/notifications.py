@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends
-
-from app.api.dependencies import get_current_user
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# pre-serialized empty list; no per-request dict or JSON encoding
+EMPTY_ITEMS_BYTES = b'{"items":[]}'
+
 
 @router.get("")
-async def list_notifications(current_user=Depends(get_current_user)):
-    # simple stub; frontend can ignore for now
-    return {"items": []}
+async def list_notifications():
+    # simple stub; frontend can ignore for now.
+    # No auth while it's a stub: it has nothing user-specific to return,
+    # so a JWT verify + user lookup per poll would be wasted work.
+    return Response(content=EMPTY_ITEMS_BYTES, media_type="application/json")
@@ -7,7 +7,7 @@ from typing import Optional
 
 from app.db.session import get_db
 from app.db import crud_properties, models
-from app.schemas.property import PropertyDetail, PropertyBase
+from app.schemas.property import PropertiesPageResponse, PropertyDetail, property_out
 
 # 🔥 ADD THESE IMPORTS
 from app.core.deps import get_current_user_optional
@@ -22,7 +22,7 @@ async def get_cities(db: AsyncSession = Depends(get_db)):
     return cities
 
 
-@router.get("/properties")
+@router.get("/properties", response_model=PropertiesPageResponse)
 async def list_properties(
     db: AsyncSession = Depends(get_db),
     city: Optional[str] = None,
@@ -49,7 +49,7 @@ async def list_properties(
         per_page=per_page,
     )
     page_obj = {
-        "items": [PropertyBase.model_validate(p).model_dump() for p in items],
+        "items": [property_out(p) for p in items],
         "total": total,
         "page": page,
         "per_page": per_page,
@@ -74,7 +74,7 @@ async def get_property_detail(
         .where(models.Property.id == prop_id)
     )
     result = await db.execute(stmt)
-    prop = result.scalars().first()
+    prop = result.scalar_one_or_none()
 
     if not prop:
         raise HTTPException(status_code=404, detail="Not found")
@@ -1,13 +1,16 @@
 from pathlib import Path
-import shutil
 
+import aiofiles
 from fastapi import APIRouter, File, UploadFile, Depends
 from app.core.config import get_settings
 from app.api.dependencies import get_current_user
 
 router = APIRouter()
 
-settings = get_settings()
+# resolved once at import instead of on every upload request
+_UPLOAD_DIR = Path(get_settings().STATIC_UPLOAD_DIR)
+_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+_CHUNK_SIZE = 1024 * 1024
 
 
 @router.post("/image")
@@ -15,11 +18,10 @@ async def upload_image(
     image: UploadFile = File(...),
     user=Depends(get_current_user),
 ):
-    upload_dir = Path(settings.STATIC_UPLOAD_DIR)
-    upload_dir.mkdir(parents=True, exist_ok=True)
     filename = f"{user.id}_{image.filename}"
-    dest = upload_dir / filename
-    with dest.open("wb") as f:
-        shutil.copyfileobj(image.file, f)
+    dest = _UPLOAD_DIR / filename
+    async with aiofiles.open(dest, "wb") as f:
+        while chunk := await image.read(_CHUNK_SIZE):
+            await f.write(chunk)
     url = f"/static/uploads/{filename}"
     return {"url": url}
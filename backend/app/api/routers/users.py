@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select
 
-from app.api.dependencies import get_current_user
+from app.api.dependencies import TokenClaims, UserSnapshot, get_current_claims, get_current_user
 from app.db.session import get_db
-from app.db.models import Booking, Property, User
+from app.db.models import Booking, Property
+from app.schemas.booking import BookedRoom, BookedRoomsResponse
 from app.schemas.user import UserBase
 
 router = APIRouter()
@@ -14,20 +18,31 @@ router = APIRouter()
 # EXISTING ENDPOINT (UNCHANGED)
 # -----------------------------
 @router.get("/me")
-async def me(current_user: User = Depends(get_current_user)):
-    return UserBase.model_validate(current_user)
+async def me(current_user: UserSnapshot = Depends(get_current_user)):
+    # trusted snapshot from get_current_user; no need to re-validate
+    return UserBase.model_construct(
+        **{f: getattr(current_user, f) for f in UserBase.model_fields}
+    )
 
 
 # -----------------------------------
 # NEW FEATURE: USER BOOKED ROOMS
 # -----------------------------------
-@router.get("/booked-rooms")
+@router.get("/booked-rooms", response_model=BookedRoomsResponse)
 async def get_my_booked_rooms(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: TokenClaims = Depends(get_current_claims),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
 ):
+    """
+    Keyset-paginated, newest start_date first. Pass the returned
+    next_cursor ("<start_date>:<booking id>") to fetch the next page;
+    the (user_id, start_date) index serves every page at the same cost.
+    """
     stmt = (
         select(
+            Booking.id,
             Property.title,
             Property.city,
             Booking.start_date,
@@ -36,24 +51,41 @@ async def get_my_booked_rooms(
         )
         .join(Property, Property.id == Booking.property_id)
         .where(Booking.user_id == current_user.id)
-        .order_by(Booking.start_date.desc())
+        .order_by(Booking.start_date.desc(), Booking.id.desc())
+        .limit(limit + 1)
     )
 
+    if cursor:
+        try:
+            raw_date, _, raw_id = cursor.partition(":")
+            cursor_date, cursor_id = date.fromisoformat(raw_date), int(raw_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        stmt = stmt.where(
+            or_(
+                Booking.start_date < cursor_date,
+                and_(Booking.start_date == cursor_date, Booking.id < cursor_id),
+            )
+        )
+
     result = await db.execute(stmt)
     rows = result.all()
 
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = f"{last.start_date.isoformat()}:{last.id}"
+
+    # column rows from our own query; no per-row validation needed
     data = [
-        {
-            "title": row.title,
-            "city": row.city,
-            "start_date": row.start_date,
-            "end_date": row.end_date,
-            "status": row.status,
-        }
+        BookedRoom.model_construct(
+            title=row.title,
+            city=row.city,
+            start_date=row.start_date,
+            end_date=row.end_date,
+            status=row.status,
+        )
         for row in rows
     ]
-
-    return {
-        "success": True,
-        "data": data,
-    }
+    return {"success": True, "data": data, "next_cursor": next_cursor}
@@ -4,7 +4,6 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from app.db.session import get_db
 from app.db.models import User
@@ -38,15 +37,14 @@ async def get_current_user(
             detail="Invalid token",
         )
 
-    user_id = payload.get("sub")
-    if not user_id:
+    user_id = payload.get("user_id")
+    if not isinstance(user_id, int):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
         )
 
-    res = await db.execute(select(User).where(User.id == int(user_id)))
-    user = res.scalar_one_or_none()
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -101,11 +99,10 @@ async def get_current_user_optional(
     except Exception:
         return None
 
-    user_id = payload.get("sub")
-    if not user_id:
+    user_id = payload.get("user_id")
+    if not isinstance(user_id, int):
         return None
 
-    res = await db.execute(select(User).where(User.id == int(user_id)))
-    user = res.scalar_one_or_none()
+    user = await db.get(User, user_id)
 
     return user
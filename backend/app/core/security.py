@@ -1,20 +1,27 @@
 # app/core/security.py
 
-from datetime import datetime, timedelta
-from typing import Any, Dict
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
 
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.token_cache import cache_payload, get_cached_payload
 
 # --------------------------------------
 # Password hashing config
 # --------------------------------------
-# bcrypt ki jagah pbkdf2_sha256 use kar rahe hain:
-# - koi 72-byte limit nahi
-# - bcrypt library version issues se bhi bach jaoge
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# argon2 (memory-hard, GPU cracking ke against kaafi strong) default hai:
+# - bcrypt jaisi 72-byte limit nahi
+# - purane pbkdf2_sha256 hashes abhi bhi verify hote hain, aur login par
+#   verify_and_update_password ke through argon2 mein rehash ho jaate hain
+pwd_context = CryptContext(
+    schemes=["argon2", "pbkdf2_sha256"],
+    deprecated=["pbkdf2_sha256"],
+)
 
 
 def get_password_hash(password: str) -> str:
@@ -25,6 +32,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password; if the stored hash uses a deprecated scheme,
+    also return a fresh hash the caller should persist (else None).
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 # --------------------------------------
 # Token creation helpers
 # --------------------------------------
@@ -37,11 +54,12 @@ def _create_token(
     token_type: str,
 ) -> str:
     to_encode = data.copy()
-    now = datetime.utcnow()
+    # epoch ints directly; PyJWT would convert datetimes to the same anyway
+    now = int(time.time())
     to_encode.update(
         {
             "iat": now,
-            "exp": now + expires_delta,
+            "exp": now + int(expires_delta.total_seconds()),
             "type": token_type,
         }
     )
@@ -71,56 +89,58 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
 # --------------------------------------
 # Token verification helpers
 # --------------------------------------
+# jwt.decode kwargs built once at import (settings are process-wide), so the
+# per-request path doesn't rebuild the algorithms list / options dict
+_ALGORITHMS = (settings.JWT_ALGORITHM,)
+_DECODE_OPTIONS = {"require": ["exp", "iat", "type"]}
+
+_DECODE_KWARGS_ACCESS: Dict[str, Any] = {
+    "key": settings.JWT_SECRET_KEY,
+    "algorithms": _ALGORITHMS,
+    "options": _DECODE_OPTIONS,
+}
+_DECODE_KWARGS_REFRESH: Dict[str, Any] = {
+    "key": settings.JWT_REFRESH_SECRET_KEY,
+    "algorithms": _ALGORITHMS,
+    "options": _DECODE_OPTIONS,
+}
 
 def decode_token(token: str) -> Dict[str, Any]:
     """
-    Decode token with either access or refresh secret.
+    Decode an access or refresh token with a single verified jwt.decode.
+    The unverified "type" claim only picks which secret to verify with;
+    a forged type still fails signature verification.
     Used mainly by /refresh; caller is responsible for checking payload["type"].
     """
-    last_error: Exception | None = None
-
-    # Try access secret
-    try:
-        return jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
-    except JWTError as e:
-        last_error = e
-
-    # Try refresh secret
-    try:
-        return jwt.decode(
-            token,
-            settings.JWT_REFRESH_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
-    except JWTError as e:
-        last_error = e
-
-    # Re-raise last error
-    raise last_error  # type: ignore[misc]
+    token_type = jwt.decode(token, options={"verify_signature": False}).get("type")
+    if token_type == "access":
+        decode_kwargs = _DECODE_KWARGS_ACCESS
+    elif token_type == "refresh":
+        decode_kwargs = _DECODE_KWARGS_REFRESH
+    else:
+        raise InvalidTokenError("Invalid token type")
+
+    return jwt.decode(token, **decode_kwargs)
 
 
 def verify_access_token(token: str) -> Dict[str, Any]:
     """
     Decode and validate an *access* token.
-    Used by get_current_user.
+    Used by the auth dependencies. Only payloads that passed every check
+    below are stored in token_cache, and decode_token never reads or writes
+    it, so a cache hit is always a verified access token.
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
-    except JWTError as e:
-        raise e
+    payload = get_cached_payload(token)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, **_DECODE_KWARGS_ACCESS)
 
     if payload.get("type") != "access":
-        raise JWTError("Invalid token type")
+        raise InvalidTokenError("Invalid token type")
 
     if "user_id" not in payload:
-        raise JWTError("Missing user_id in token")
+        raise InvalidTokenError("Missing user_id in token")
 
+    cache_payload(token, payload)
     return payload
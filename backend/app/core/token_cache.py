@@ -0,0 +1,59 @@
+# app/core/token_cache.py
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+# --------------------------------------
+# Verified JWT payload cache
+# --------------------------------------
+# Signature verification runs on almost every request; a short-lived cache
+# lets repeat requests with the same bearer skip it. Entries never outlive
+# the token's own "exp", and failed decodes are never stored.
+TOKEN_CACHE_TTL_SECONDS = 5
+TOKEN_CACHE_MAXSIZE = 10000
+
+_cache: TTLCache = TTLCache(maxsize=TOKEN_CACHE_MAXSIZE, ttl=TOKEN_CACHE_TTL_SECONDS)
+_lock = threading.Lock()
+
+
+def _cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def get_cached_payload(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the payload of a recently verified token, or None on miss.
+    """
+    key = _cache_key(token)
+    with _lock:
+        entry = _cache.get(key)
+    if entry is None:
+        return None
+
+    payload, expires_at = entry
+    if expires_at <= time.time():
+        with _lock:
+            _cache.pop(key, None)
+        return None
+    return payload
+
+
+def cache_payload(token: str, payload: Dict[str, Any]) -> None:
+    """
+    Remember a successfully verified payload for at most
+    min(TOKEN_CACHE_TTL_SECONDS, exp - now) seconds.
+    """
+    now = time.time()
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if exp is not None:
+        expires_at = min(expires_at, float(exp))
+    if expires_at <= now:
+        return
+
+    with _lock:
+        _cache[_cache_key(token)] = (payload, expires_at)
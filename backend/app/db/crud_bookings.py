@@ -1,54 +1,128 @@
 # app/db/crud_bookings.py
 
-from datetime import date
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, lambda_stmt, literal, select
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Booking, Property
 
 
-async def create_booking(
+class BookingOverlapError(ValueError):
+    """The requested dates overlap an existing booking for the property."""
+
+
+# MySQL ER_LOCK_DEADLOCK / ER_LOCK_WAIT_TIMEOUT
+_LOCK_CONFLICT_CODES = {1213, 1205}
+
+
+def _is_lock_conflict(exc: OperationalError) -> bool:
+    args = getattr(exc.orig, "args", ())
+    return bool(args) and args[0] in _LOCK_CONFLICT_CODES
+
+
+async def create_booking_if_property_exists(
     db: AsyncSession,
     *,
     user_id: int,
     property_id: int,
     start_date: date,
     end_date: date,
-) -> Booking:
-    booking = Booking(
+) -> Optional[Booking]:
+    """
+    One INSERT ... SELECT FROM properties WHERE id = :property_id AND NOT
+    EXISTS (overlapping booking), so the existence check, the overlap check
+    and the insert share one statement and one round trip.
+    Returns None when the property does not exist; raises
+    BookingOverlapError when the dates clash with an existing booking.
+    """
+    created_at = datetime.utcnow()
+    # ix_bookings_property_dates serves the overlap subquery
+    overlap = select(Booking.id).where(
+        Booking.property_id == property_id,
+        Booking.start_date < end_date,
+        Booking.end_date > start_date,
+    )
+    source = select(
+        literal(user_id, Booking.user_id.type),
+        Property.id,
+        literal(start_date, Booking.start_date.type),
+        literal(end_date, Booking.end_date.type),
+        literal("pending", Booking.status.type),
+        literal(created_at, Booking.created_at.type),
+    ).where(Property.id == property_id, ~overlap.exists())
+
+    try:
+        res = await db.execute(
+            insert(Booking).from_select(
+                ["user_id", "property_id", "start_date", "end_date", "status", "created_at"],
+                source,
+            )
+        )
+        if res.rowcount == 0:
+            # failure path only: tell a missing property from an overlap
+            found = await db.scalar(select(Property.id).where(Property.id == property_id))
+            await db.rollback()
+            if found is None:
+                return None
+            raise BookingOverlapError("Dates overlap an existing booking")
+        await db.commit()
+    except OperationalError as exc:
+        # two overlapping inserts racing on the same property can still lose
+        # an InnoDB deadlock / lock wait; the loser is the overlap, not a 500
+        if not _is_lock_conflict(exc):
+            raise
+        await db.rollback()
+        raise BookingOverlapError("Dates overlap a concurrent booking") from exc
+
+    # every column value is known client-side; no refresh SELECT needed
+    return Booking(
+        id=res.lastrowid,
         user_id=user_id,
         property_id=property_id,
         start_date=start_date,
         end_date=end_date,
         status="pending",
+        created_at=created_at,
     )
-    db.add(booking)
-    await db.commit()
-    await db.refresh(booking)
-    return booking
 
 
 async def list_bookings_for_user(db: AsyncSession, user_id: int) -> List[Booking]:
-    stmt = (
-        select(Booking)
+    # lambda_stmt caches the constructed statement; user_id is bound per call
+    stmt = lambda_stmt(
+        lambda: select(Booking)
         .where(Booking.user_id == user_id)
         .order_by(Booking.id.desc())
     )
     res = await db.execute(stmt)
-    return list(res.scalars().all())
+    return res.scalars().all()
 
 
-async def list_bookings_for_host(db: AsyncSession, host_id: int) -> List[Booking]:
+async def list_bookings_for_host(
+    db: AsyncSession,
+    host_id: int,
+    page: int = 1,
+    per_page: int = 50,
+) -> Tuple[List[Booking], int]:
     """
     All bookings for properties owned by host_id
     """
+    total = (
+        await db.execute(
+            select(func.count(Booking.id))
+            .join(Property, Booking.property_id == Property.id)
+            .where(Property.host_id == host_id)
+        )
+    ).scalar_one()
     stmt = (
         select(Booking)
         .join(Property, Booking.property_id == Property.id)
         .where(Property.host_id == host_id)
         .order_by(Booking.id.desc())
+        .offset((page - 1) * per_page)
+        .limit(per_page)
     )
     res = await db.execute(stmt)
-    return list(res.scalars().all())
+    return res.scalars().all(), int(total)
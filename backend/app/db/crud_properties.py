@@ -4,7 +4,7 @@ from typing import Tuple, List, Dict, Any
 
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.db.models import Property
 
@@ -70,33 +70,58 @@ async def list_properties(
         # default: recent first
         stmt = stmt.order_by(Property.id.desc())
 
-    # count total
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_res = await db.execute(count_stmt)
-    total = total_res.scalar_one()
-
+    # page + total in one query: COUNT(*) OVER () is evaluated before LIMIT
     offset = (page - 1) * per_page
-    stmt = stmt.offset(offset).limit(per_page)
-    res = await db.execute(stmt)
-    items = list(res.scalars().all())
+    paged_stmt = (
+        stmt.add_columns(func.count().over().label("total"))
+        # PropertyBase has no host field; fail loudly instead of lazy-loading
+        # per row if a serializer starts to (switch to selectinload then)
+        .options(raiseload(Property.host))
+        .offset(offset)
+        .limit(per_page)
+    )
+    res = await db.execute(paged_stmt)
+    rows = res.all()
+    items = [row.Property for row in rows]
+
+    if rows:
+        total = rows[0].total
+    elif page == 1:
+        total = 0
+    else:
+        # page past the end: no row to read the window total from;
+        # count over the predicates directly (no derived table / ORDER BY)
+        count_stmt = select(func.count(Property.id)).where(and_(*where_clauses))
+        total = (await db.execute(count_stmt)).scalar_one()
     return items, int(total)
 
 
 async def get_property(db: AsyncSession, prop_id: int) -> Property | None:
-    res = await db.execute(select(Property).where(Property.id == prop_id))
-    return res.scalars().first()
+    return await db.get(Property, prop_id)
 
 
-async def list_properties_for_host(db: AsyncSession, host_id: int) -> List[Property]:
+async def list_properties_for_host(
+    db: AsyncSession,
+    host_id: int,
+    page: int = 1,
+    per_page: int = 50,
+) -> Tuple[List[Property], int]:
     """
     Host dashboard: show ALL their properties, regardless of approval_status.
     """
+    total = (
+        await db.execute(
+            select(func.count(Property.id)).where(Property.host_id == host_id)
+        )
+    ).scalar_one()
     res = await db.execute(
         select(Property)
         .where(Property.host_id == host_id)
         .order_by(Property.id.desc())
+        .offset((page - 1) * per_page)
+        .limit(per_page)
     )
-    return list(res.scalars().all())
+    return res.scalars().all(), int(total)
 
 
 async def create_property(db: AsyncSession, **kwargs) -> Property:
@@ -130,31 +155,51 @@ async def delete_property(db: AsyncSession, prop: Property):
 
 # --- ADMIN: get all properties with uploader (host) ---
 
-async def list_all_properties_with_uploader(db: AsyncSession) -> List[Property]:
+async def list_all_properties_with_uploader(
+    db: AsyncSession,
+    page: int = 1,
+    per_page: int = 50,
+) -> Tuple[List[Property], int]:
     """
     Admin full list: ALL properties (any status), with host loaded.
     """
+    total = (await db.execute(select(func.count(Property.id)))).scalar_one()
     stmt = (
         select(Property)
         .options(selectinload(Property.host))   # load uploader/host
         .order_by(Property.id.desc())
+        .offset((page - 1) * per_page)
+        .limit(per_page)
     )
-    res = await db.execute(stmt)
-    return list(res.scalars().all())
+    # selectinload: one properties SELECT + one users WHERE id IN (...) per page
+    res = await db.scalars(stmt)
+    return res.all(), int(total)
 
 
-async def list_pending_properties_with_uploader(db: AsyncSession) -> List[Property]:
+async def list_pending_properties_with_uploader(
+    db: AsyncSession,
+    page: int = 1,
+    per_page: int = 50,
+) -> Tuple[List[Property], int]:
     """
     Admin view: only PENDING properties + host relationship.
     """
+    total = (
+        await db.execute(
+            select(func.count(Property.id)).where(Property.approval_status == "pending")
+        )
+    ).scalar_one()
     stmt = (
         select(Property)
         .options(selectinload(Property.host))
         .where(Property.approval_status == "pending")
         .order_by(Property.id.desc())
+        .offset((page - 1) * per_page)
+        .limit(per_page)
     )
-    res = await db.execute(stmt)
-    return list(res.scalars().all())
+    # selectinload: one properties SELECT + one users WHERE id IN (...) per page
+    res = await db.scalars(stmt)
+    return res.all(), int(total)
 
 
 async def approve_property(
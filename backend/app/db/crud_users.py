@@ -1,8 +1,9 @@
 # app/db/crud_users.py
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
-from sqlalchemy import select, update
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, insert, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import User, UserRefreshToken
@@ -10,18 +11,28 @@ from app.core.security import get_password_hash
 
 
 async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
-    res = await db.execute(select(User).where(User.id == user_id))
-    return res.scalar_one_or_none()
+    return await db.get(User, user_id)
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
-    res = await db.execute(select(User).where(User.email == email))
+    # hit on every login; lambda_stmt skips rebuilding the SELECT per call
+    res = await db.execute(lambda_stmt(lambda: select(User).where(User.email == email)))
     return res.scalar_one_or_none()
 
 
-async def list_users(db: AsyncSession) -> List[User]:
-    res = await db.execute(select(User).order_by(User.id.desc()))
-    return list(res.scalars().all())
+async def list_users(
+    db: AsyncSession,
+    page: int = 1,
+    per_page: int = 50,
+) -> Tuple[List[User], int]:
+    total = (await db.execute(select(func.count(User.id)))).scalar_one()
+    res = await db.execute(
+        select(User)
+        .order_by(User.id.desc())
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+    return res.scalars().all(), int(total)
 
 
 async def create_user(
@@ -39,7 +50,8 @@ async def create_user(
     and:
       await create_user(db, name=..., email=..., password=..., phone=...)
     """
-    hashed = get_password_hash(password)
+    # argon2 takes ~100 ms of CPU; run it off the event loop
+    hashed = await run_in_threadpool(get_password_hash, password)
     user = User(
         name=name,
         email=email,
@@ -53,14 +65,20 @@ async def create_user(
     return user
 
 
+async def update_password_hash(db: AsyncSession, user: User, hashed_password: str) -> None:
+    """
+    Store an upgraded password hash (e.g. pbkdf2_sha256 -> argon2 on login).
+    """
+    user.hashed_password = hashed_password
+    await db.commit()
+
+
 async def update_user_role(db: AsyncSession, user_id: int, role: str) -> User:
-    res = await db.execute(select(User).where(User.id == user_id))
-    user = res.scalar_one_or_none()
+    user = await db.get(User, user_id)
     if not user:
         raise ValueError("User not found")
 
     user.role = role
-    db.add(user)
     await db.commit()
     await db.refresh(user)
     return user
@@ -69,17 +87,20 @@ async def update_user_role(db: AsyncSession, user_id: int, role: str) -> User:
 async def save_refresh_token(db: AsyncSession, user_id: int, token: str) -> None:
     """
     Store a new refresh token for the user.
-    Simple strategy: revoke existing, then insert new.
+    Simple strategy: revoke existing, then insert new, in one transaction.
+    Expects a session with no transaction in progress.
     """
-    # Revoke all active tokens for that user
-    await db.execute(
-        update(UserRefreshToken)
-        .where(UserRefreshToken.user_id == user_id, UserRefreshToken.revoked == False)  # noqa: E712
-        .values(revoked=True)
-    )
-
-    db.add(UserRefreshToken(user_id=user_id, token=token))
-    await db.commit()
+    async with db.begin():
+        # Revoke all active tokens for that user (seeks ix_urt_user_active)
+        await db.execute(
+            update(UserRefreshToken)
+            .where(UserRefreshToken.user_id == user_id, UserRefreshToken.revoked == False)  # noqa: E712
+            .values(revoked=True)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(
+            insert(UserRefreshToken).values(user_id=user_id, token=token, revoked=False)
+        )
 
 
 async def revoke_refresh_token(db: AsyncSession, token: str) -> None:
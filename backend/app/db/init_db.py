@@ -0,0 +1,21 @@
+# app/db/init_db.py
+# One-shot schema creation for dev / fresh databases:
+#   python -m app.db.init_db
+# Production databases are managed with alembic (see alembic/versions).
+import asyncio
+
+from app.db.base import Base
+from app.db import models  # noqa: F401  (registers tables on Base.metadata)
+from app.db.session import engine
+
+
+async def init_db() -> None:
+    """
+    Create any missing tables. Existing tables are left untouched.
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+if __name__ == "__main__":
+    asyncio.run(init_db())
@@ -13,6 +13,7 @@ from sqlalchemy import (
     Numeric,
     Boolean,
     JSON,
+    Index,
 )
 from sqlalchemy.orm import relationship
 
@@ -67,14 +68,22 @@ class User(Base):
 
 class Property(Base):
     __tablename__ = "properties"
+    __table_args__ = (
+        # public listing: WHERE approval_status = ? AND is_active AND city = ?
+        # ORDER BY id DESC (default) or price (price_asc / price_desc)
+        Index("ix_prop_public_recent", "approval_status", "is_active", "city", "id"),
+        Index("ix_prop_public_price", "approval_status", "is_active", "city", "price"),
+        # host dashboard: WHERE host_id = ? ORDER BY id DESC
+        Index("ix_prop_host_recent", "host_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
+    # indexed via ix_prop_host_recent
     host_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     title = Column(String(255), nullable=False)
@@ -95,11 +104,11 @@ class Property(Base):
 
     # Approval fields
     # "pending" | "approved" | "rejected"
+    # indexed as the leading column of ix_prop_public_*
     approval_status = Column(
         String(20),
         nullable=False,
         default="pending",
-        index=True,
     )
     approved_at = Column(DateTime, nullable=True)
     approved_by_admin_id = Column(
@@ -131,20 +140,28 @@ class Property(Base):
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # per-user history, ordered by start_date
+        Index("ix_bookings_user_start", "user_id", "start_date"),
+        # availability / overlap lookups for a property
+        Index("ix_bookings_property_dates", "property_id", "start_date", "end_date"),
+        # host bookings: JOIN on property_id ORDER BY id DESC
+        Index("ix_bookings_host_recent", "property_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
+    # indexed via ix_bookings_user_start
     user_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
+    # indexed via ix_bookings_property_dates / ix_bookings_host_recent
     property_id = Column(
         Integer,
         ForeignKey("properties.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     start_date = Column(Date, nullable=False)
@@ -159,14 +176,20 @@ class Booking(Base):
 
 class UserRefreshToken(Base):
     __tablename__ = "user_refresh_tokens"
+    __table_args__ = (
+        # same prefix index as sql/sql; revoke_refresh_token looks up by token
+        Index("idx_user_refresh_tokens_token", "token", mysql_length=191),
+        # save_refresh_token revokes WHERE user_id = ? AND revoked = false
+        Index("ix_urt_user_active", "user_id", "revoked"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
+    # indexed via ix_urt_user_active
     user_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     token = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,31 +1,34 @@
 # backend/app/db/session.py
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings  # NOTE: instance import, NOT class
 
 
 # Create engine using instance settings (NOT Settings.DATABASE_URL)
+# No poolclass here on purpose: async engines need the default AsyncAdaptedQueuePool.
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
 # Session factory
-AsyncSessionLocal = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
+# autoflush=False: CRUD code commits explicitly, so read queries skip the pre-query flush
+AsyncSessionLocal = async_sessionmaker(
+    engine,
     expire_on_commit=False,
+    autoflush=False,
 )
 
 
-# FastAPI dependency
+# FastAPI dependency (the context manager closes the session)
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
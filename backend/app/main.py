@@ -1,11 +1,13 @@
 import uvicorn
 import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.core.config import Settings
-from app.db.base import Base
+from app.core.config import settings
+from app.db.init_db import init_db
 from app.db.session import engine
 from app.api.routers import (
     auth as auth_router,
@@ -19,9 +21,21 @@ from app.api.routers import (
     notifications as notifications_router,
 )
 
-settings = Settings()
 
-app = FastAPI(title=settings.PROJECT_NAME)
+# ---------------------------
+# Lifespan
+# ---------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # create_all costs a metadata round-trip per table on every worker boot;
+    # production schemas come from alembic instead
+    if settings.AUTO_CREATE_TABLES:
+        await init_db()
+    yield
+    await engine.dispose()
+
+
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
 
 # ---------------------------
 # CORS
@@ -48,14 +62,6 @@ STATIC_DIR = os.path.join(BASE_DIR, "static")
 
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
-# ---------------------------
-# Startup
-# ---------------------------
-@app.on_event("startup")
-async def on_startup():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
 # ---------------------------
 # Routers
 # ---------------------------
@@ -1,5 +1,7 @@
 # backend/app/schemas/booking.py
 from datetime import date, datetime
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -19,3 +21,33 @@ class BookingOut(BaseModel):
 
     # Pydantic v2 style – replaces orm_mode=True
     model_config = {"from_attributes": True}
+
+
+class BookingList(BaseModel):
+    """GET /api/bookings/bookings: { items }"""
+    items: list[BookingOut]
+
+
+class BookingsPage(BaseModel):
+    """GET /api/host/bookings"""
+    items: list[BookingOut]
+    total: int
+    page: int
+    per_page: int
+
+
+class BookedRoom(BaseModel):
+    title: str
+    city: str
+    start_date: date
+    end_date: date
+    status: str
+
+    model_config = {"from_attributes": True}
+
+
+class BookedRoomsResponse(BaseModel):
+    """GET /api/users/booked-rooms, keyset-paginated"""
+    success: bool = True
+    data: list[BookedRoom]
+    next_cursor: Optional[str] = None
@@ -1,4 +1,5 @@
 # backend/app/schemas/property.py
+from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel
 
@@ -15,10 +16,11 @@ class HostInfo(BaseModel):
 class PropertyBase(BaseModel):
     id: int
     title: str
-    description: str
+    # nullable columns
+    description: Optional[str] = None
     price: float
     city: str
-    locality: str
+    locality: Optional[str] = None
     type: str
     gender: str
     images: List[str]
@@ -61,3 +63,81 @@ class PropertiesPage(BaseModel):
     total: int
     page: int
     per_page: int
+
+
+# ---- list responses
+# List endpoints fill these with model_construct'ed items (property_out /
+# admin_property_out): rows from the DB are trusted, and FastAPI does not
+# re-validate model instances, so only the JSON serialization runs per row.
+
+class PropertiesPageResponse(BaseModel):
+    """GET /api/properties: { success, data: PropertiesPage }"""
+    success: bool = True
+    data: PropertiesPage
+
+
+class HostPropertiesResponse(BaseModel):
+    """GET /api/host/properties: { data: PropertiesPage }"""
+    data: PropertiesPage
+
+
+class AdminPropertyOut(PropertyBase):
+    """PropertyBase plus moderation fields and the uploader."""
+    is_active: bool
+    created_at: Optional[datetime] = None
+    approved_at: Optional[datetime] = None
+    approved_by_admin_id: Optional[int] = None
+    host: Optional[HostInfo] = None
+
+
+class AdminPropertiesPage(BaseModel):
+    items: list[AdminPropertyOut]
+    total: int
+    page: int
+    per_page: int
+
+
+class AdminPropertiesResponse(BaseModel):
+    data: AdminPropertiesPage
+
+
+def _property_fields(prop) -> dict:
+    return {
+        "id": prop.id,
+        "title": prop.title,
+        "description": prop.description,
+        # Numeric -> float, as PropertyBase validation would do
+        "price": float(prop.price),
+        "city": prop.city,
+        "locality": prop.locality,
+        "type": prop.type,
+        "gender": prop.gender,
+        "images": prop.images,
+        "host_id": prop.host_id,
+        "approval_status": prop.approval_status,
+    }
+
+
+def property_out(prop) -> PropertyBase:
+    """
+    Trusted ORM row -> PropertyBase, skipping per-row validation.
+    """
+    return PropertyBase.model_construct(**_property_fields(prop))
+
+
+def admin_property_out(prop) -> AdminPropertyOut:
+    """
+    property_out plus moderation fields and the uploader.
+    Expects prop.host to be eagerly loaded.
+    """
+    host = prop.host
+    return AdminPropertyOut.model_construct(
+        **_property_fields(prop),
+        is_active=prop.is_active,
+        created_at=prop.created_at,
+        approved_at=prop.approved_at,
+        approved_by_admin_id=prop.approved_by_admin_id,
+        host=HostInfo.model_construct(id=host.id, name=host.name, phone=host.phone)
+        if host is not None
+        else None,
+    )
@@ -40,3 +40,15 @@ class UserOut(UserBase):
     Abhi ke liye UserOut == UserBase, but we can customize later.
     """
     pass
+
+
+class UsersPage(BaseModel):
+    items: list[UserBase]
+    total: int
+    page: int
+    per_page: int
+
+
+class AdminUsersResponse(BaseModel):
+    """GET /api/admin/users: { data: UsersPage }"""
+    data: UsersPage
@@ -1 +1,11 @@
 # scripts/runserver.sh
+# Production server: one uvicorn process per core, uvloop event loop and
+# httptools parser (both ship with uvicorn[standard]).
+# Each worker opens up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections, so
+# lower WEB_CONCURRENCY (or the pool settings) if that exceeds MySQL max_connections.
+exec uvicorn app.main:app \
+    --host 0.0.0.0 \
+    --port "${PORT:-8000}" \
+    --workers "${WEB_CONCURRENCY:-$(nproc)}" \
+    --loop uvloop \
+    --http httptools
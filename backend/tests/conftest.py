@@ -0,0 +1,74 @@
+# tests/conftest.py
+import os
+import tempfile
+
+# settings are read once at import; point the app at a throwaway SQLite DB first
+_TMP = tempfile.mkdtemp(prefix="flatmate-tests-")
+_DB_PATH = os.path.join(_TMP, "test.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+os.environ["STATIC_UPLOAD_DIR"] = os.path.join(_TMP, "uploads")
+os.environ["AUTO_CREATE_TABLES"] = "true"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from app.main import app
+from app.api.dependencies import invalidate_cached_user, user_cache
+from app.db.models import User
+from app.db.session import AsyncSessionLocal
+
+
+@pytest.fixture
+def client():
+    # fresh schema per test (lifespan runs create_all)
+    if os.path.exists(_DB_PATH):
+        os.remove(_DB_PATH)
+    user_cache.clear()
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def set_role(client):
+    """
+    set_role(user_id, role): change a role directly in the DB, as an operator would.
+    """
+    def _set_role(user_id: int, role: str) -> None:
+        async def _update():
+            async with AsyncSessionLocal() as db:
+                await db.execute(update(User).where(User.id == user_id).values(role=role))
+                await db.commit()
+
+        client.portal.call(_update)
+        invalidate_cached_user(user_id)
+
+    return _set_role
+
+
+@pytest.fixture
+def register(client, set_role):
+    """
+    register(email, role="user") -> token response of a fresh login,
+    with an extra "headers" entry holding the access-token bearer header.
+    """
+    def _register(email: str, role: str = "user", password: str = "pw") -> dict:
+        r = client.post(
+            "/api/auth/register",
+            json={
+                "name": email.split("@")[0],
+                "email": email,
+                "password": password,
+                "phone": "9999999999",
+            },
+        )
+        assert r.status_code == 200, r.text
+        if role != "user":
+            set_role(r.json()["user"]["id"], role)
+        r = client.post("/api/auth/login", json={"email": email, "password": password})
+        assert r.status_code == 200, r.text
+        tokens = r.json()
+        tokens["headers"] = {"Authorization": f"Bearer {tokens['access_token']}"}
+        return tokens
+
+    return _register
@@ -1 +1,57 @@
 # tests/test_admin.py
+import pytest
+from sqlalchemy import update
+
+from app.db.models import Property
+from app.db.session import AsyncSessionLocal
+
+
+@pytest.fixture
+def property_with_null_columns(client, register):
+    host = register("host@example.com", role="host")
+    r = client.post(
+        "/api/host/properties",
+        headers=host["headers"],
+        data={"title": "Bare room", "price": "100", "city": "Delhi"},
+    )
+    assert r.status_code == 200, r.text
+    prop_id = r.json()["data"]["id"]
+
+    # description / locality are nullable; rows from sql/sql or older clients have NULLs
+    async def _null_out():
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(Property)
+                .where(Property.id == prop_id)
+                .values(description=None, locality=None)
+            )
+            await db.commit()
+
+    client.portal.call(_null_out)
+    return prop_id
+
+
+def test_admin_lists_return_rows_with_null_columns(client, register, property_with_null_columns):
+    admin = register("admin@example.com", role="admin")
+
+    for path in ("/api/admin/properties", "/api/admin/properties/pending"):
+        r = client.get(path, headers=admin["headers"])
+        assert r.status_code == 200, r.text
+        [item] = r.json()["data"]["items"]
+        assert item["id"] == property_with_null_columns
+        assert item["description"] is None
+        assert item["locality"] is None
+        assert item["price"] == 100.0
+        assert item["host"]["name"] == "host"
+
+
+def test_admin_users_page(client, register):
+    admin = register("admin@example.com", role="admin")
+    register("guest@example.com")
+
+    r = client.get("/api/admin/users", headers=admin["headers"], params={"per_page": 1})
+    assert r.status_code == 200, r.text
+    data = r.json()["data"]
+    assert data["total"] == 2
+    assert data["page"] == 1 and data["per_page"] == 1
+    assert [u["email"] for u in data["items"]] == ["guest@example.com"]
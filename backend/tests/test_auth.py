@@ -1 +1,42 @@
 # tests/test_auth.py
+
+
+def test_access_token_authenticates(client, register):
+    tokens = register("a@example.com")
+    r = client.get("/api/users/me", headers=tokens["headers"])
+    assert r.status_code == 200
+    assert r.json()["email"] == "a@example.com"
+
+
+def test_refresh_token_is_not_a_bearer_credential(client, register):
+    tokens = register("a@example.com")
+    headers = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+
+    # claims-only and full-user routes alike
+    assert client.get("/api/users/booked-rooms", headers=headers).status_code == 401
+    assert client.get("/api/bookings/bookings", headers=headers).status_code == 401
+    assert client.get("/api/users/me", headers=headers).status_code == 401
+
+
+def test_refresh_token_cannot_reach_admin_routes_after_logout(client, register):
+    admin = register("admin@example.com", role="admin")
+    client.post("/api/auth/logout", json={"refresh": admin["refresh_token"]})
+
+    headers = {"Authorization": f"Bearer {admin['refresh_token']}"}
+    assert client.get("/api/admin/users", headers=headers).status_code == 401
+
+
+def test_demoted_admin_loses_admin_routes(client, register):
+    a = register("a@example.com", role="admin")
+    b = register("b@example.com", role="admin")
+    a_id, b_id = a["user"]["id"], b["user"]["id"]
+
+    r = client.put(f"/api/admin/users/{a_id}/role", headers=b["headers"], json={"role": "user"})
+    assert r.status_code == 200
+
+    # a's access token still says role=admin; the stored role must win
+    assert client.get("/api/admin/users", headers=a["headers"]).status_code == 403
+    r = client.put(f"/api/admin/users/{b_id}/role", headers=a["headers"], json={"role": "user"})
+    assert r.status_code == 403
+    r = client.post("/api/admin/properties/1/approve", headers=a["headers"])
+    assert r.status_code == 403
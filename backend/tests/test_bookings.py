@@ -0,0 +1,126 @@
+# tests/test_bookings.py
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.db import crud_bookings
+
+
+def _create_property(client, headers, title: str) -> int:
+    r = client.post(
+        "/api/host/properties",
+        headers=headers,
+        data={"title": title, "price": "100", "city": "Delhi"},
+    )
+    assert r.status_code == 200, r.text
+    return r.json()["data"]["id"]
+
+
+def _book(client, headers, property_id: int, start: date, nights: int = 1):
+    return client.post(
+        "/api/bookings/bookings",
+        headers=headers,
+        json={
+            "property_id": property_id,
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=nights)).isoformat(),
+        },
+    )
+
+
+def test_booked_rooms_cursor_walks_ties_on_start_date(client, register):
+    host = register("host@example.com", role="host")
+    guest = register("guest@example.com")
+    same_day = date.today() + timedelta(days=10)
+    earlier = date.today() + timedelta(days=5)
+
+    # three bookings share a start_date (different rooms), one starts earlier
+    for title in ("R1", "R2", "R3"):
+        pid = _create_property(client, host["headers"], title)
+        assert _book(client, guest["headers"], pid, same_day).status_code == 200
+    pid = _create_property(client, host["headers"], "R0")
+    assert _book(client, guest["headers"], pid, earlier).status_code == 200
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        r = client.get("/api/users/booked-rooms", headers=guest["headers"], params=params)
+        assert r.status_code == 200, r.text
+        body = r.json()
+        seen.extend(row["title"] for row in body["data"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 2
+    # newest start_date first, ties by booking id descending; nothing lost or repeated
+    assert seen == ["R3", "R2", "R1", "R0"]
+
+
+def test_booked_rooms_rejects_invalid_cursor(client, register):
+    guest = register("guest@example.com")
+    for cursor in ("garbage", "2024-13-01:1", "2024-01-01:x", "2024-01-01"):
+        r = client.get(
+            "/api/users/booked-rooms", headers=guest["headers"], params={"cursor": cursor}
+        )
+        assert r.status_code == 400, cursor
+
+
+def test_overlapping_booking_is_rejected(client, register):
+    host = register("host@example.com", role="host")
+    guest = register("guest@example.com")
+    pid = _create_property(client, host["headers"], "R1")
+    other = _create_property(client, host["headers"], "R2")
+    start = date.today() + timedelta(days=3)
+
+    assert _book(client, guest["headers"], pid, start, nights=3).status_code == 200
+    # same dates, and a partial overlap on either side
+    assert _book(client, guest["headers"], pid, start, nights=3).status_code == 409
+    assert _book(client, guest["headers"], pid, start - timedelta(days=1), nights=2).status_code == 409
+    assert _book(client, guest["headers"], pid, start + timedelta(days=2), nights=2).status_code == 409
+    # back-to-back stays and other rooms are fine
+    assert _book(client, guest["headers"], pid, start + timedelta(days=3)).status_code == 200
+    assert _book(client, guest["headers"], other, start, nights=3).status_code == 200
+
+
+class _DeadlockingSession:
+    """Stands in for an AsyncSession whose INSERT loses an InnoDB deadlock."""
+
+    def __init__(self, code: int):
+        self.code = code
+        self.rolled_back = False
+
+    async def execute(self, stmt):
+        raise OperationalError("INSERT ... SELECT", {}, Exception(self.code, "lock"))
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+def test_lock_conflict_maps_to_overlap():
+    for code in (1213, 1205):
+        db = _DeadlockingSession(code)
+        with pytest.raises(crud_bookings.BookingOverlapError):
+            asyncio.run(
+                crud_bookings.create_booking_if_property_exists(
+                    db, user_id=1, property_id=1,
+                    start_date=date(2030, 1, 1), end_date=date(2030, 1, 2),
+                )
+            )
+        assert db.rolled_back
+
+    # other operational errors are not swallowed
+    with pytest.raises(OperationalError):
+        asyncio.run(
+            crud_bookings.create_booking_if_property_exists(
+                _DeadlockingSession(2006), user_id=1, property_id=1,
+                start_date=date(2030, 1, 1), end_date=date(2030, 1, 2),
+            )
+        )
@@ -1 +1,57 @@
 # tests/test_host.py
+from pathlib import Path
+
+import pytest
+
+from app.api.routers import host as host_router
+
+
+def _upload_path(url: str) -> Path:
+    return host_router._UPLOAD_DIR / url.rsplit("/", 1)[-1]
+
+
+def test_same_named_images_get_separate_files(client, register):
+    tokens = register("host@example.com", role="host")
+    big_a = b"A" * (3 * 1024 * 1024)
+    small_b = b"B" * (1024 * 1024)
+
+    r = client.post(
+        "/api/host/properties",
+        headers=tokens["headers"],
+        data={"title": "Room", "price": "100", "city": "Delhi"},
+        files=[
+            ("images", ("photo.jpg", big_a, "image/jpeg")),
+            ("images", ("photo.jpg", small_b, "image/jpeg")),
+        ],
+    )
+    assert r.status_code == 200, r.text
+    urls = r.json()["data"]["images"]
+
+    assert len(set(urls)) == 2
+    assert _upload_path(urls[0]).read_bytes() == big_a
+    assert _upload_path(urls[1]).read_bytes() == small_b
+
+
+def test_failed_image_write_removes_written_files(client, register, monkeypatch):
+    tokens = register("host@example.com", role="host")
+    real_save = host_router._save
+
+    async def flaky_save(img, dest):
+        await real_save(img, dest)
+        if img.filename == "bad.jpg":
+            raise OSError("disk full")
+
+    monkeypatch.setattr(host_router, "_save", flaky_save)
+    before = set(host_router._UPLOAD_DIR.iterdir())
+
+    with pytest.raises(OSError):
+        client.post(
+            "/api/host/properties",
+            headers=tokens["headers"],
+            data={"title": "Room", "price": "100", "city": "Delhi"},
+            files=[
+                ("images", ("good.jpg", b"good", "image/jpeg")),
+                ("images", ("bad.jpg", b"bad", "image/jpeg")),
+            ],
+        )
+    assert set(host_router._UPLOAD_DIR.iterdir()) == before
@@ -423,10 +423,12 @@ const app = (function () {
       }
       return body;
     },
-    async getHostBookings() {
-      const res = await withAuthFetch(`${BASE_API_URL}/api/host/bookings`, {
-        method: 'GET'
-      });
+    async getHostBookings(params = {}) {
+      const qs = new URLSearchParams(params).toString();
+      const res = await withAuthFetch(
+        `${BASE_API_URL}/api/host/bookings${qs ? `?${qs}` : ''}`,
+        { method: 'GET' }
+      );
       const body = await res.json().catch(() => ({}));
       if (!res.ok) {
         throw new Error(
@@ -439,10 +441,12 @@ const app = (function () {
     },
 
     // Admin
-    async getAdminUsers() {
-      const res = await withAuthFetch(`${BASE_API_URL}/api/admin/users`, {
-        method: 'GET'
-      });
+    async getAdminUsers(params = {}) {
+      const qs = new URLSearchParams(params).toString();
+      const res = await withAuthFetch(
+        `${BASE_API_URL}/api/admin/users${qs ? `?${qs}` : ''}`,
+        { method: 'GET' }
+      );
       const body = await res.json().catch(() => ({}));
       if (!res.ok) {
         throw new Error(
@@ -489,9 +493,10 @@ const app = (function () {
     },
 
     // NEW: Admin pending listings APIs
-    async getAdminPendingProperties() {
+    async getAdminPendingProperties(params = {}) {
+      const qs = new URLSearchParams(params).toString();
       const res = await withAuthFetch(
-        `${BASE_API_URL}/api/admin/properties/pending`,
+        `${BASE_API_URL}/api/admin/properties/pending${qs ? `?${qs}` : ''}`,
         { method: 'GET' }
       );
       const body = await res.json().catch(() => ({}));
@@ -1429,6 +1434,53 @@ const app = (function () {
     history.pushState({}, '', qs ? `${base}?${qs}` : base);
   }
 
+  // Dashboard lists are page-numbered: { data: { items, total, page, per_page } }.
+  // Fetch one page per request and page through with Prev / Next under the list.
+  const DASHBOARD_PER_PAGE = 20;
+  const dashboardPages = {};
+
+  async function fetchListPage(key, fetchPage, page) {
+    const body = await fetchPage({ page, per_page: DASHBOARD_PER_PAGE });
+    const data = body?.data || body || {};
+    const items = data.items || [];
+    const total = Number(data.total ?? items.length);
+    const per_page = Number(data.per_page || DASHBOARD_PER_PAGE);
+    const last = Math.max(1, Math.ceil(total / per_page));
+    // the page emptied under us (e.g. its last row was deleted): show the new last page
+    if (!items.length && page > last) return fetchListPage(key, fetchPage, last);
+    dashboardPages[key] = page;
+    return { items, total, page, per_page };
+  }
+
+  function renderListPager(container, { total = 0, page = 1, per_page = DASHBOARD_PER_PAGE }, onPage) {
+    if (!container) return;
+    let pager = document.getElementById(`${container.id}Pager`);
+    if (!pager) {
+      pager = document.createElement('div');
+      pager.id = `${container.id}Pager`;
+      pager.className = 'pager';
+      pager.style.marginTop = '12px';
+      container.after(pager);
+    }
+    pager.innerHTML = '';
+    const pages = Math.max(1, Math.ceil(total / per_page));
+    if (pages <= 1) return;
+    const makeBtn = (label, target, disabled) => {
+      const b = document.createElement('button');
+      b.className = 'btn btn-outline';
+      b.textContent = label;
+      b.disabled = disabled;
+      b.addEventListener('click', () => onPage(target));
+      return b;
+    };
+    const info = document.createElement('span');
+    info.style.margin = '0 8px';
+    info.textContent = `Page ${page} of ${pages}`;
+    pager.appendChild(makeBtn('Prev', page - 1, page <= 1));
+    pager.appendChild(info);
+    pager.appendChild(makeBtn('Next', page + 1, page >= pages));
+  }
+
   /* Auto-load / page wiring functions */
   async function autoLoadIndex() {
     try {
@@ -1531,25 +1583,30 @@ const app = (function () {
     updateAuthLinks();
   }
 
-  async function loadHostProperties() {
+  async function loadHostProperties(page = dashboardPages.hostProperties || 1) {
     try {
-      const res = await api.getHostProperties();
-      const list = res?.data?.items || res?.items || [];
-      ui.renderHostProperties(list);
+      const data = await fetchListPage(
+        'hostProperties', (p) => api.getHostProperties(p), page
+      );
+      ui.renderHostProperties(data.items);
+      renderListPager(
+        document.getElementById('hostProperties'), data, loadHostProperties
+      );
     } catch (err) {
       ui.showToast(err.message || 'Failed to load host properties', 'error');
     }
     updateAuthLinks();
   }
 
-  async function loadHostBookings() {
+  async function loadHostBookings(page = dashboardPages.hostBookings || 1) {
     try {
-      const res = await api.getHostBookings();
-      const list = res?.data?.items || res?.items || [];
+      const data = await fetchListPage(
+        'hostBookings', (p) => api.getHostBookings(p), page
+      );
       const root = document.getElementById('hostBookings');
       if (!root) return;
       root.innerHTML = '';
-      (list || []).forEach((b) => {
+      data.items.forEach((b) => {
         const el = document.createElement('div');
         el.className = 'card';
         el.innerHTML = `<div><strong>Booking ${b.id
@@ -1557,6 +1614,7 @@ const app = (function () {
           }</div></div>`;
         root.appendChild(el);
       });
+      renderListPager(root, data, loadHostBookings);
     } catch (err) {
       ui.showToast(err.message || 'Failed to load host bookings', 'error');
     }
@@ -1567,39 +1625,70 @@ const app = (function () {
     const container = document.getElementById('bookedRoomsContainer');
     if (!container) return;
 
-    try {
+    // /booked-rooms is keyset-paginated: pass back next_cursor for the next page
+    const fetchPage = async (cursor) => {
+      const qs = cursor ? `?${new URLSearchParams({ cursor })}` : '';
       const res = await withAuthFetch(
-        `${BASE_API_URL}/api/users/booked-rooms`,
+        `${BASE_API_URL}/api/users/booked-rooms${qs}`,
         { method: 'GET' }
       );
-
       const body = await res.json().catch(() => ({}));
-      const list = body?.data || [];
-
-      if (!list.length) {
-        container.innerHTML = '<p>No booked rooms yet.</p>';
-        return;
-      }
-
-      container.innerHTML = '';
+      if (!res.ok) throw new Error(body?.detail || 'Failed to load booked rooms');
+      return body;
+    };
 
+    const renderRooms = (list) => {
       list.forEach(b => {
         const el = document.createElement('div');
         el.className = 'card';
         el.style.marginTop = '12px';
 
         el.innerHTML = `
-        <strong>${b.title}</strong>
+        <strong>${escapeHtml(b.title)}</strong>
         <div style="color:var(--muted); margin-top:4px">
-          ${b.city}<br/>
-          ${b.start_date} → ${b.end_date}<br/>
-          Status: ${b.status}
+          ${escapeHtml(b.city)}<br/>
+          ${escapeHtml(b.start_date)} → ${escapeHtml(b.end_date)}<br/>
+          Status: ${escapeHtml(b.status)}
         </div>
       `;
 
         container.appendChild(el);
       });
+    };
+
+    const renderLoadMore = (cursor) => {
+      if (!cursor) return;
+      const btn = document.createElement('button');
+      btn.className = 'btn btn-outline';
+      btn.style.marginTop = '12px';
+      btn.textContent = 'Load more';
+      btn.addEventListener('click', async () => {
+        btn.disabled = true;
+        try {
+          const body = await fetchPage(cursor);
+          btn.remove();
+          renderRooms(body?.data || []);
+          renderLoadMore(body?.next_cursor);
+        } catch (err) {
+          btn.disabled = false;
+          ui.showToast(err.message || 'Failed to load booked rooms', 'error');
+        }
+      });
+      container.appendChild(btn);
+    };
+
+    try {
+      const body = await fetchPage(null);
+      const list = body?.data || [];
+
+      if (!list.length) {
+        container.innerHTML = '<p>No booked rooms yet.</p>';
+        return;
+      }
 
+      container.innerHTML = '';
+      renderRooms(list);
+      renderLoadMore(body?.next_cursor);
     } catch (err) {
       container.innerHTML = '<p>Failed to load booked rooms.</p>';
     }
@@ -1628,12 +1717,21 @@ const app = (function () {
     } catch (err) {
       // ignore stats errors
     }
+    await loadAdminUsers();
+    await loadAdminProperties();
+    // NEW: load pending listings section
+    await loadAdminPendingProperties();
+  }
+
+  async function loadAdminUsers(page = dashboardPages.adminUsers || 1) {
     try {
-      const users = await api.getAdminUsers();
+      const data = await fetchListPage(
+        'adminUsers', (p) => api.getAdminUsers(p), page
+      );
       const ul = document.getElementById('adminUsers');
       if (ul) {
         ul.innerHTML = '';
-        (users?.data || users || []).forEach((u) => {
+        data.items.forEach((u) => {
           const el = document.createElement('div');
           el.className = 'card';
           el.innerHTML = `<div style="display:flex;justify-content:space-between"><div>${escapeHtml(
@@ -1678,25 +1776,40 @@ const app = (function () {
             }
           })
         );
+        renderListPager(ul, data, loadAdminUsers);
       }
     } catch (err) {
       ui.showToast(err.message || 'Failed to load admin users', 'error');
     }
+  }
 
+  async function loadAdminProperties(page = dashboardPages.adminProperties || 1) {
     try {
-      const props = await api.getAdminProperties();
-      const list = props?.data?.items || props?.items || [];
-      ui.renderAdminProperties(list);
+      const data = await fetchListPage(
+        'adminProperties', (p) => api.getAdminProperties(p), page
+      );
+      ui.renderAdminProperties(data.items);
+      renderListPager(
+        document.getElementById('adminProperties'), data, loadAdminProperties
+      );
     } catch (err) {
       ui.showToast(err.message || 'Failed to load admin properties', 'error');
     }
+  }
 
-    // NEW: load pending listings section
+  async function loadAdminPendingProperties(
+    page = dashboardPages.adminPendingProperties || 1
+  ) {
     try {
-      const pendingRes = await api.getAdminPendingProperties();
-      const pendingList =
-        pendingRes?.data?.items || pendingRes?.items || [];
-      ui.renderAdminPendingProperties(pendingList);
+      const data = await fetchListPage(
+        'adminPendingProperties', (p) => api.getAdminPendingProperties(p), page
+      );
+      ui.renderAdminPendingProperties(data.items);
+      renderListPager(
+        document.getElementById('adminPendingProperties'),
+        data,
+        loadAdminPendingProperties
+      );
     } catch (err) {
       ui.showToast(
         err.message || 'Failed to load pending listings',